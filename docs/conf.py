@@ -15,15 +15,14 @@ release = '0.0.1'
 
 import os
 import sys
-sys.path.insert(0, os.path.abspath('../src'))
+# Resolved from this file so the path does not depend on the working directory
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
 
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    'sphinx.ext.viewcode',
-    'sphinx.ext.autodoc',
-    'sphinx.ext.autosummary',
     'graphiql_sphinx',
     'sphinx_rapidoc'
 ]
@@ -37,3 +36,6 @@ exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
 html_theme = 'sphinx_rtd_theme'
 html_static_path = ['_static']
+# The .rst sources are not useful to readers; skip copying and linking them
+html_copy_source = False
+html_show_sourcelink = False
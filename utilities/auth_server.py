@@ -1,12 +1,11 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, Literal, Dict, Any
-import boto3
-from botocore.auth import SigV4Auth
-from botocore.awsrequest import AWSRequest
-import json
-import base64
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+from typing import Optional, Literal, Dict, Union, Annotated
+from functools import lru_cache
 
 app = FastAPI(title="AWS Auth Token Server")
 
@@ -19,18 +18,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-class TokenRequest(BaseModel):
-    auth_type: Literal["COGNITO", "API_KEY"]
-    username: Optional[str] = None
-    password: Optional[str] = None
-    api_key: Optional[str] = None
-    # Cognito specific fields
-    client_id: Optional[str] = None
-    region: Optional[str] = None
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Report invalid token requests with a single string detail, as the auth pages display it as is"""
+    messages = []
+    for error in exc.errors():
+        # loc is ("body", <auth_type>, <field>) for a field of the selected model
+        field = error["loc"][-1] if len(error["loc"]) > 1 else None
+        messages.append(f"{field}: {error['msg']}" if field is not None else error["msg"])
+    return JSONResponse(status_code=400, content={"detail": "; ".join(messages)})
+
+
+RequiredStr = Annotated[str, Field(min_length=1)]
+
+
+class BaseTokenRequest(BaseModel):
     # Target API details
     api_url: Optional[str] = None
     method: str = "POST"
-    
+
+
+class CognitoTokenRequest(BaseTokenRequest):
+    auth_type: Literal["COGNITO"]
+    username: RequiredStr
+    password: RequiredStr
+    # Cognito specific fields
+    client_id: RequiredStr
+    region: RequiredStr
+
+
+class ApiKeyTokenRequest(BaseTokenRequest):
+    auth_type: Literal["API_KEY"]
+    api_key: RequiredStr
+
+
+# Pydantic picks the model from auth_type and enforces its required fields
+TokenRequest = Annotated[
+    Union[CognitoTokenRequest, ApiKeyTokenRequest],
+    Field(discriminator="auth_type")
+]
+
 
 class TokenResponse(BaseModel):
     authorization_header: str
@@ -40,6 +68,9 @@ class TokenResponse(BaseModel):
 
 # def generate_sigv4_auth_header(credentials, url, method, region, service='execute-api'):
 #     """Generate AWS SigV4 signature for API Gateway"""
+#     from botocore.auth import SigV4Auth
+#     from botocore.awsrequest import AWSRequest
+#
 #     request = AWSRequest(
 #         method=method,
 #         url=url,
@@ -52,9 +83,20 @@ class TokenResponse(BaseModel):
 #     return request.headers['Authorization']
 
 
+@lru_cache(maxsize=16)
+def _cognito_client(region: str):
+    """Return a Cognito client for the region, built once and reused across requests"""
+    # Imported here so API_KEY-only servers never pay for loading boto3
+    import boto3
+
+    # Handlers run in the threadpool and boto3's default session is not thread-safe,
+    # so each client gets its own session
+    return boto3.session.Session().client('cognito-idp', region_name=region)
+
+
 def get_cognito_token(username: str, password: str, client_id: str, region: str) -> str:
     """Get Cognito authentication token using user credentials"""
-    client = boto3.client('cognito-idp', region_name=region)
+    client = _cognito_client(region)
     
     try:
         response = client.initiate_auth(
@@ -74,6 +116,10 @@ def get_cognito_token(username: str, password: str, client_id: str, region: str)
 # def get_lambda_token(lambda_function_name: str, payload: Dict[str, Any], 
 #                     region: str, credentials) -> Dict[str, str]:
 #     """Invoke Lambda authorizer and get token/headers"""
+#     import base64
+#     import json
+#     import boto3
+#
 #     try:
 #         lambda_client = boto3.client(
 #             'lambda',
@@ -139,6 +185,8 @@ async def get_token(request: TokenRequest):
         #             detail="access_key, secret_key, and region are required for IAM authentication"
         #         )
             
+        #     import boto3
+        #
         #     credentials = boto3.Session(
         #         aws_access_key_id=request.access_key,
         #         aws_secret_access_key=request.secret_key,
@@ -157,14 +205,10 @@ async def get_token(request: TokenRequest):
         #         token_type="AWS_IAM_SIGV4"
         #     )
             
-        if request.auth_type == "COGNITO":
-            if not all([request.username, request.password, request.client_id, request.region]):
-                raise HTTPException(
-                    status_code=400,
-                    detail="username, password, client_id, and region are required for Cognito authentication"
-                )
-            
-            token = get_cognito_token(
+        if isinstance(request, CognitoTokenRequest):
+            # boto3 is blocking, keep the Cognito round trip off the event loop
+            token = await run_in_threadpool(
+                get_cognito_token,
                 request.username,
                 request.password,
                 request.client_id,
@@ -176,13 +220,7 @@ async def get_token(request: TokenRequest):
                 token_type="COGNITO_JWT"
             )
             
-        elif request.auth_type == "API_KEY":
-            if not request.api_key:
-                raise HTTPException(
-                    status_code=400,
-                    detail="api_key is required for API_KEY authentication"
-                )
-                            
+        elif isinstance(request, ApiKeyTokenRequest):
             return TokenResponse(
                 authorization_header=request.api_key,
                 token_type="API_KEY"
@@ -214,12 +252,6 @@ async def get_token(request: TokenRequest):
         #         additional_headers=headers
         #     )
             
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported auth_type: {request.auth_type}"
-            )
-            
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
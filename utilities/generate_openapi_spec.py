@@ -1,9 +1,133 @@
 import ast
+import inspect
 import re
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import sys
 import os
+from functools import lru_cache
+
+try:
+    # Optional, much faster JSON encoder; the stdlib json module is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse plain modules for the running grammar without type comments.
+# No optimize level: from Python 3.14, optimize=2 strips the docstrings the spec is built from
+_PARSE_KWARGS: Dict[str, Any] = {
+    "mode": "exec",
+    "type_comments": False,
+    "feature_version": sys.version_info[:2]
+}
+
+# Cheap byte-level check for files that can contain a route decorator at all
+_ROUTE_CALL_PATTERN = re.compile(rb'\.route\s*\(')
+
+# Matches the "Summary:", "Method:" and "Description:" docstring lines in one pass
+_DOCSTRING_FIELD_PATTERN = re.compile(r'^(Summary|Method|Description):\s*(.+)$', re.IGNORECASE)
+
+def _json_responses(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a responses object with a single successful application/json response.
+    
+    Args:
+        schema (Dict[str, Any]): Schema of the response body
+    
+    Returns:
+        Dict containing the OpenAPI responses object
+    """
+    return {
+        "200": {
+            "description": "Successful response",
+            "content": {
+                "application/json": {
+                    "schema": schema
+                }
+            }
+        }
+    }
+
+def _encode_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON, using orjson when it is installed.
+    
+    Args:
+        data (Any): JSON serializable data
+        pretty (bool, optional): Indent the output by two spaces. Defaults to False.
+    
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    # json.dumps without indent runs on the C encoder
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+@lru_cache(maxsize=None)
+def _parse_file(path: str, mtime: float) -> Tuple[Optional[ast.Module], int]:
+    """
+    Parse a source file into an AST, reusing the result while the file is unchanged.
+    
+    Args:
+        path (str): Path to the Python source file
+        mtime (float): Modification time of the file, part of the cache key
+    
+    Returns:
+        Tuple of the ast.Module (None if the file has no .route() call) and the
+        number of .route() calls in the source, an upper bound on its route decorators
+    """
+    with open(path, 'rb') as file:
+        source = file.read()
+    
+    route_count = len(_ROUTE_CALL_PATTERN.findall(source))
+    if not route_count:
+        return None, 0
+    
+    return ast.parse(source, filename=path, **_PARSE_KWARGS), route_count
+
+class _RoutesCollected(Exception):
+    """Raised by _RouteCollector to stop the traversal once every route is found."""
+
+class _RouteCollector(ast.NodeVisitor):
+    """
+    Single pass AST visitor that hands every @app.route() decorated function
+    to the generator, reading the decorators straight off the function node.
+    """
+    
+    # Only statement blocks can hold function definitions, expressions are never entered
+    _BLOCK_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+    
+    def __init__(self, generator: "OpenAPISpecGenerator", route_count: int):
+        self.generator = generator
+        self.remaining_routes = route_count
+    
+    def collect(self, tree: ast.Module) -> None:
+        """Visit the tree, stopping early once route_count routes have been added."""
+        try:
+            self.visit(tree)
+        except _RoutesCollected:
+            pass
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for block_field in self._BLOCK_FIELDS:
+            for child in getattr(node, block_field, ()):
+                self.visit(child)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        for decorator in node.decorator_list:
+            if (isinstance(decorator, ast.Call) and 
+                isinstance(decorator.func, ast.Attribute) and 
+                decorator.func.attr == 'route'):
+                self.generator._add_route(node, decorator)
+                self.remaining_routes -= 1
+                if self.remaining_routes <= 0:
+                    raise _RoutesCollected()
+        self.generic_visit(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
 
 class OpenAPISpecGenerator:
     """
@@ -78,44 +202,36 @@ class OpenAPISpecGenerator:
         # Default specification structure
         spec = {
             "summary": "",
-            "description": docstring,
-            "responses": {
-                "200": {
-                    "description": "Successful response",
-                    "content": {
-                        "application/json": {
-                            "schema": {"type": "object"}
-                        }
-                    }
-                }
-            }
+            "description": None,
+            "responses": _json_responses({"type": "object"})
         }
         
         # Split docstring into lines and process
-        lines = [line.strip() for line in docstring.split('\n')]
-        
-        # Extract key details
-        for line in lines:
-            # Try to extract summary
-            summary_match = re.match(r'^Summary:\s*(.+)$', line, re.IGNORECASE)
-            if summary_match:
-                spec['summary'] = str(summary_match.group(1))
-            
-            # Try to extract method
-            method_match = re.match(r'^Method:\s*(.+)$', line, re.IGNORECASE)
-            if method_match:
-                spec['method'] = method_match.group(1)
-            
-            # Try to extract description
-            description_match = re.match(r'^Description:\s*(.+)$', line, re.IGNORECASE)
-            if description_match:
-                spec['description'] = description_match.group(1)
+        lines = [line.strip() for line in docstring.splitlines()]
         
-        # Try to parse request and response details
-        try:
-            request_start = lines.index("Request:")
-            response_start = lines.index("Response:")
+        # Extract key details and locate the Request/Response sections in one pass
+        request_start = response_start = None
+        for index, line in enumerate(lines):
+            if line == "Request:":
+                if request_start is None:
+                    request_start = index
+                continue
+            if line == "Response:":
+                if response_start is None:
+                    response_start = index
+                continue
             
+            # Try to extract summary, method or description
+            field_match = _DOCSTRING_FIELD_PATTERN.match(line)
+            if field_match:
+                spec[field_match.group(1).lower()] = field_match.group(2)
+        
+        # Without an explicit Description line, fall back to the cleaned docstring
+        if spec['description'] is None:
+            spec['description'] = inspect.cleandoc(docstring)
+        
+        # Parse request and response details, keep defaults if either section is missing
+        if request_start is not None and response_start is not None:
             # Extract request details
             request_details = lines[request_start+1:response_start]
             request_schema = {"type": "object", "properties": {}}
@@ -140,15 +256,55 @@ class OpenAPISpecGenerator:
                         "description": description.strip()
                     }
             
-            # Update responses in spec
-            spec['responses']['200']['content']['application/json']['schema'] = response_schema
-            
-        except ValueError:
-            # If no explicit Request/Response sections found, keep defaults
-            pass
+            # Replace the shared default responses with this endpoint's schema
+            spec['responses'] = _json_responses(response_schema)
         
         return spec
     
+    def _add_route(self, func_node: ast.FunctionDef, decorator: ast.Call) -> None:
+        """
+        Add the operations of a single routed function to the specification.
+        
+        Args:
+            func_node (ast.FunctionDef): Function decorated with @app.route()
+            decorator (ast.Call): The route decorator applied to the function
+        """
+        route_details = self._extract_route_details(decorator)
+        path = route_details["path"]
+        methods = route_details["methods"]
+        content_types = route_details["content_types"]
+        
+        # Extract docstring
+        # Lines are stripped while parsing, so skip cleaning the whole docstring here
+        docstring = ast.get_docstring(func_node, clean=False) or ""
+        
+        # Parse docstring for specification details
+        parsed_spec = self._parse_docstring_specification(docstring)
+        
+        # Construct the operation object once, each method gets its own copy below
+        responses = parsed_spec.get('responses')
+        if responses is None:
+            responses = {
+                "200": {
+                    "description": "Successful response",
+                    "content": {
+                        content_type: {
+                            "schema": {"type": "object"}
+                        } for content_type in content_types
+                    }
+                }
+            }
+        operation = {
+            "summary": parsed_spec.get('summary', f"Endpoint for {func_node.name}"),
+            "description": parsed_spec.get('description', docstring),
+            "responses": responses
+        }
+        
+        # Add to paths, merging methods into an existing path entry
+        path_item = self.spec["paths"].setdefault(path, {})
+        for method in methods:
+            path_item[method.lower()] = operation.copy()
+    
     def generate_specification(self) -> Dict[str, Any]:
         """
         Generate the complete OpenAPI specification by parsing multiple Lambda functions.
@@ -158,72 +314,32 @@ class OpenAPISpecGenerator:
         """
         # Process each lambda file
         for lambda_file_path in self.lambda_file_paths:
-            with open(lambda_file_path, 'r') as file:
-                file_content = file.read()
-                tree = ast.parse(file_content)
-            
-            for node in ast.walk(tree):
-                # Look for route decorators
-                if (isinstance(node, ast.Call) and 
-                    isinstance(node.func, ast.Attribute) and 
-                    node.func.attr == 'route'):
-                    
-                    # Find the corresponding function definition
-                    func_node = next(
-                        (parent for parent in ast.iter_child_nodes(tree) 
-                         if isinstance(parent, ast.FunctionDef) and 
-                         parent.lineno > node.lineno), 
-                        None
-                    )
-                    
-                    if func_node:
-                        route_details = self._extract_route_details(node)
-                        
-                        # Extract docstring
-                        docstring = ast.get_docstring(func_node) or ""
-                        
-                        # Parse docstring for specification details
-                        parsed_spec = self._parse_docstring_specification(docstring)
-                        
-                        # Construct operation object for each method
-                        for method in route_details["methods"]:
-                            operation = {
-                                "summary": parsed_spec.get('summary', f"Endpoint for {func_node.name}"),
-                                "description": parsed_spec.get('description', docstring),
-                                "responses": parsed_spec.get('responses', {
-                                    "200": {
-                                        "description": "Successful response",
-                                        "content": {
-                                            content_type: {
-                                                "schema": {"type": "object"}
-                                            } for content_type in route_details["content_types"]
-                                        }
-                                    }
-                                })
-                            }
-                            
-                            # Add to paths, handling potential path conflicts
-                            if route_details["path"] in self.spec["paths"]:
-                                # If path exists, update or merge methods
-                                self.spec["paths"][route_details["path"]][method.lower()] = operation
-                            else:
-                                # Add new path entry
-                                self.spec["paths"][route_details["path"]] = {
-                                    method.lower(): operation
-                                }
-        
+            self._add_file(lambda_file_path)
         return self.spec
     
-    def save_specification(self, output_path: str = "openapi_spec.json"):
+    def _add_file(self, lambda_file_path: str) -> None:
+        """
+        Add the routes of a single Lambda file to the specification.
+        
+        Args:
+            lambda_file_path (str): Path to the Lambda function Python file
+        """
+        tree, route_count = _parse_file(lambda_file_path, os.path.getmtime(lambda_file_path))
+        if tree is not None:
+            _RouteCollector(self, route_count).collect(tree)
+    
+    def save_specification(self, output_path: str = "openapi_spec.json", pretty: bool = False):
         """
         Save the generated specification to a file.
         
         Args:
             output_path (str, optional): Path to save the specification file. 
                                          Defaults to "openapi_spec.json".
+            pretty (bool, optional): Indent the JSON for human readers.
+                                     Defaults to False (compact output).
         """
-        with open(output_path, 'w') as spec_file:
-            json.dump(self.spec, spec_file, indent=2)
+        with open(output_path, 'wb') as spec_file:
+            spec_file.write(_encode_json(self.spec, pretty))
         
         print(f"OpenAPI specification saved to {output_path}")
 
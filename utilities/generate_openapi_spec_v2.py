@@ -1,13 +1,30 @@
 from abc import ABC, abstractmethod
 import ast
+import bisect
+import inspect
 import re
 import json
-from typing import Dict, List, Optional, Any, Type
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple, Type, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
 import os
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yaml
+    # BaseLoader keeps every scalar a str, so documentation text is never
+    # reinterpreted as YAML 1.1 booleans, octals or sexagesimal numbers
+    _YAML_LOADER = getattr(yaml, 'CBaseLoader', yaml.BaseLoader)
+except ImportError:
+    yaml = None
+
 def setup_logging():
     log_dir = 'logs'
     os.makedirs(log_dir, exist_ok=True)
@@ -24,7 +41,139 @@ def setup_logging():
 
 logger = setup_logging()
 
-@dataclass
+# Regex patterns shared by the parsers and detectors below
+# Bare keys at the start of a line or right after '{' / ',' in pseudo-JSON
+_KEYIFY_RE = re.compile(r'(^|[{,])\s*(\w+)\s*:', re.MULTILINE)
+_PATH_PARAM_RE = re.compile(r'[{<]([^}>]+)[}>]')
+# Python """...""" docstrings (group 1) or JavaScript /*...*/ comments (group 2)
+_DOC_BLOCK_RE = re.compile(r'"""(.*?)"""|/\*(.*?)\*/', re.DOTALL)
+_JS_DOC_RE = re.compile(r'/\*(.*?)\*/', re.DOTALL)
+# Docstring "Field: value" lines and bare "Section:" headers
+_DOC_LINE_RE = re.compile(
+    r'(?:(?P<field>endpoint|method|description|summary):(?P<value>.*)'
+    r'|(?P<section>parameters|request|response|errors|error|security):$)',
+    re.IGNORECASE
+)
+_DOC_FIELD_KEYS = {
+    'endpoint': 'path',
+    'description': 'description',
+    'summary': 'summary'
+}
+_DOC_SECTIONS = {
+    'parameters': 'parameters',
+    'request': 'parameters',
+    'response': 'response',
+    'errors': 'error',
+    'error': 'error',
+    'security': 'security'
+}
+_TS_ROUTE_RE = re.compile(r'(app|router)\.(get|post|put|delete)\s*\(\s*[\'"]([^\'"]+)[\'"]')
+# Shared string objects for the few HTTP methods and media types endpoints repeat
+_HTTP_METHODS = {m: sys.intern(m) for m in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS', 'HEAD')}
+_CONTENT_TYPES = {ct: sys.intern(ct) for ct in ('application/json', 'application/xml', 'text/plain',
+                                                'multipart/form-data', 'application/x-www-form-urlencoded')}
+# Bare call names treated as FastAPI route declarations
+_FASTAPI_METHODS = frozenset({'get', 'post', 'put', 'delete'})
+
+# Parse plain modules without type comments, the detectors only need calls and docstrings
+_PARSE_KWARGS: Dict[str, Any] = {"mode": "exec", "type_comments": False}
+
+@lru_cache(maxsize=None)
+def _load_cached(path: str, mtime: float) -> Tuple[str, Optional[ast.Module]]:
+    """
+    Read a source file once, reusing its content and AST while the file is unchanged.
+    
+    Args:
+        path: Path to the source file
+        mtime: Modification time of the file, part of the cache key
+        
+    Returns:
+        Tuple of (decoded content with universal newlines, parsed AST for Python sources)
+    """
+    with open(path, 'rb') as file:
+        source = file.read()
+    
+    # Parse the raw bytes so the parser honours encoding declarations
+    tree = ast.parse(source, filename=path, **_PARSE_KWARGS) if path.endswith('.py') else None
+    content = source.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    return content, tree
+
+# Security scheme required by every operation, keyed by the input file's auth type
+_AUTH_SCHEMES = {
+    "api_key": "ApiKeyAuth",
+    "cognito": "CognitoAuth"
+}
+
+# Fields of statements (and except handlers / match cases) holding nested statements
+_STATEMENT_BLOCKS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+def _detect_python_framework(tree: ast.Module) -> str:
+    """
+    Detect the web framework of a Python module from its imports.
+    
+    Imports nested in statement blocks, such as try/except ImportError or if
+    guards, are found as well; expressions are never visited.
+    
+    Args:
+        tree: Parsed AST of the module
+        
+    Returns:
+        'fastapi' or 'flask' when the module imports one of them, 'vanilla' otherwise
+    """
+    framework = 'vanilla'
+    pending = list(reversed(tree.body))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules = [node.module]
+        else:
+            # Descend into nested statement blocks (if/try/with/def bodies, handlers, match cases)
+            for block in _STATEMENT_BLOCKS:
+                children = getattr(node, block, None)
+                if children:
+                    pending.extend(reversed(children))
+            continue
+        for module in modules:
+            package = module.partition('.')[0]
+            if package == 'fastapi':
+                return 'fastapi'
+            if package == 'flask':
+                framework = 'flask'
+    return framework
+
+@lru_cache(maxsize=None)
+def _parse_response_fields(response_text: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """
+    Parse a docstring response block into (field, description) pairs.
+    
+    Args:
+        response_text: Raw response block, either JSON or pseudo-JSON with bare keys
+        
+    Returns:
+        Tuple of field name/value pairs, or None if the block cannot be parsed
+    """
+    try:
+        response_schema = json.loads(response_text)
+    except json.JSONDecodeError:
+        if yaml is not None:
+            # Pseudo-JSON with bare keys is a YAML flow mapping
+            try:
+                response_schema = yaml.load(response_text, Loader=_YAML_LOADER)
+            except yaml.YAMLError:
+                return None
+        else:
+            # Convert the pseudo-JSON format to proper JSON
+            try:
+                response_schema = json.loads(_KEYIFY_RE.sub(r'\1"\2":', response_text))
+            except json.JSONDecodeError:
+                return None
+    if not isinstance(response_schema, dict):
+        return None
+    return tuple((str(k), str(v)) for k, v in response_schema.items())
+
+@dataclass(slots=True)
 class EndpointInfo:
     """Data class to store endpoint information."""
     path: str
@@ -36,17 +185,7 @@ class EndpointInfo:
     response_schema: Dict[str, Any]
     content_types: List[str]
     security: List[Dict[str, Any]]
-    _errors: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-
-    @property
-    def errors(self) -> Dict[str, Dict[str, Any]]:
-        """Getter for errors property."""
-        return self._errors
-
-    @errors.setter
-    def errors(self, value: Dict[str, Dict[str, Any]]):
-        """Setter for errors property."""
-        self._errors = value
+    errors: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 class ParameterParser:
     """Parser for extracting and categorizing endpoint parameters."""
@@ -64,11 +203,9 @@ class ParameterParser:
         """
         path_params = []
         # Match both {param} and <param> formats
-        param_pattern = r'[{<]([^}>]+)[}>]'
-        
-        for match in re.finditer(param_pattern, path):
+        for match in _PATH_PARAM_RE.finditer(path):
             param_name = match.group(1)
-            param_dict = {
+            path_params.append({
                 "name": param_name,
                 "in": "path",
                 "required": True,  # Path parameters are always required
@@ -76,8 +213,7 @@ class ParameterParser:
                     "type": "string"  # Default to string, can be overridden by docstring
                 },
                 "description": f"Path parameter: {param_name}"
-            }
-            path_params.append(param_dict)
+            })
             
         return path_params
 
@@ -149,46 +285,40 @@ class DocstringParser:
             "response_schema": {"type": "object", "properties": {}},
             "content_types": ["application/json"],
             "security": [],
-            "_errors": {}
+            "errors": {}
         }
         
-        # Split docstring into lines and clean
-        lines = [line.strip() for line in docstring.split('\n')]
         current_section = None
-        response_json_started = False
+        response_json_depth = 0
         response_json_content = []
         
-        for line in lines:
+        # Walk the docstring line by line, cleaning each line as it is reached
+        for raw_line in docstring.splitlines():
+            line = raw_line.strip()
             if not line:
                 continue
                 
+            # Classify field and section header lines with a single match; bullets
+            # and '{' openers can never match, so they skip the regex
+            first = line[0]
+            line_match = _DOC_LINE_RE.match(line) if first != '-' and first != '{' else None
+            
             # Check for main endpoint information
-            if line.lower().startswith('endpoint:'):
-                info['path'] = line.split(':', 1)[1].strip()
-            elif line.lower().startswith('method:'):
-                methods = line.split(':', 1)[1].strip()
-                info['methods'] = [m.strip() for m in methods.split(',')]
-            elif line.lower().startswith('description:'):
-                info['description'] = line.split(':', 1)[1].strip()
-            elif line.lower().startswith('summary:'):
-                info['summary'] = line.split(':', 1)[1].strip()
-            
-            # Handle parameters section
-            elif line.lower() == 'parameters:' or line.lower() == 'request:':
-                current_section = 'parameters'
-                continue
-            elif line.lower() == 'response:':
-                current_section = 'response'
-                continue
-            elif line.lower() == 'errors:' or line.lower() == 'error:':
-                current_section = 'error'
-                continue
-            elif line.lower() == 'security:':
-                current_section = 'security'
+            if line_match and line_match.group('field'):
+                field_name = line_match.group('field').lower()
+                value = line_match.group('value').strip()
+                if field_name == 'method':
+                    info['methods'] = [_HTTP_METHODS.get(m.strip(), m.strip()) for m in value.split(',')]
+                else:
+                    info[_DOC_FIELD_KEYS[field_name]] = value
+            
+            # Handle section headers
+            elif line_match:
+                current_section = _DOC_SECTIONS[line_match.group('section').lower()]
                 continue
             
             # Process sections
-            elif current_section == 'parameters' and line.startswith('-'):
+            elif first == '-' and current_section == 'parameters':
                 # Parse parameter
                 param_line = line[1:].strip()
                 if ':' in param_line:
@@ -210,40 +340,37 @@ class DocstringParser:
             
             # Handle response schema
             elif current_section == 'response':
-                if line.startswith('{'):
-                    response_json_started = True
+                if not response_json_depth and first == '{':
                     response_json_content = [line]
-                elif response_json_started:
+                elif response_json_depth:
                     response_json_content.append(line)
-                    if line.strip().endswith('}'):
-                        # Try to parse complete JSON response
-                        try:
-                            response_text = ' '.join(response_json_content)
-                            # Convert the pseudo-JSON format to proper JSON
-                            response_text = re.sub(r'(\w+):', r'"\1":', response_text)
-                            response_schema = json.loads(response_text)
-                            info['response_schema'] = {
-                                "type": "object",
-                                "properties": {
-                                    k: {"type": "string", "description": str(v)}
-                                    for k, v in response_schema.items()
-                                }
+                else:
+                    continue
+                # Parse only once the outer braces are balanced, not on every nested '}'
+                response_json_depth += line.count('{') - line.count('}')
+                if response_json_depth <= 0:
+                    response_json_depth = 0
+                    response_fields = _parse_response_fields('\n'.join(response_json_content))
+                    if response_fields is not None:
+                        info['response_schema'] = {
+                            "type": "object",
+                            "properties": {
+                                k: {"type": "string", "description": v}
+                                for k, v in response_fields
                             }
-                        except json.JSONDecodeError:
-                            pass
-                        response_json_started = False
+                        }
 
             # Handle error responses
-            elif current_section == 'error' and line.startswith('-'):
+            elif first == '-' and current_section == 'error':
                 error_line = line[1:].strip()
                 if ':' in error_line:
                     error_code, error_desc = error_line.split(':', 1)
-                    info['_errors'][error_code.strip()] = {
+                    info['errors'][error_code.strip()] = {
                         "description": error_desc.strip(),
                     }
             
             # Handle security requirements
-            elif current_section == 'security' and line.startswith('-'):
+            elif first == '-' and current_section == 'security':
                 security_req = line[1:].strip()
                 if ':' in security_req:
                     sec_type, sec_desc = security_req.split(':', 1)
@@ -254,6 +381,7 @@ class DocstringParser:
         
         # Only create EndpointInfo if we found an endpoint path
         if info['path']:
+            info['path'] = sys.intern(info['path'])
             # Default to GET if no method specified
             if not info['methods']:
                 info['methods'] = ['GET']
@@ -265,6 +393,60 @@ class DocstringParser:
         
         return None
 
+# Route handlers may be plain or async functions
+_FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+class _FunctionCollector(ast.NodeVisitor):
+    """AST visitor collecting every function definition of a tree."""
+    
+    def __init__(self):
+        self.functions: List[_FunctionNode] = []
+    
+    def visit_FunctionDef(self, node: _FunctionNode) -> None:
+        self.functions.append(node)
+        self.generic_visit(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+def _function_defs(tree: ast.Module) -> List[_FunctionNode]:
+    """
+    Collect the function definitions of a tree in source order.
+    
+    Args:
+        tree: Parsed AST to search
+        
+    Returns:
+        List of function definitions sorted by line number
+    """
+    collector = _FunctionCollector()
+    collector.visit(tree)
+    return sorted(collector.functions, key=lambda n: n.lineno)
+
+def _iter_route_calls(tree: ast.Module,
+                      call_matcher: Callable[[ast.Call], bool]) -> Iterable[Tuple[ast.Call, _FunctionNode]]:
+    """
+    Yield each route decorator of a tree together with the function it decorates.
+    
+    Args:
+        tree: Parsed AST to search
+        call_matcher: Test applied to every decorator call
+        
+    Returns:
+        Iterator of (decorator call, function definition) pairs in source order
+    """
+    for func_def in _function_defs(tree):
+        for decorator in func_def.decorator_list:
+            if isinstance(decorator, ast.Call) and call_matcher(decorator):
+                yield decorator, func_def
+
+def _is_route_call(node: ast.Call) -> bool:
+    """Match app.route(...) / blueprint.route(...) calls."""
+    return isinstance(node.func, ast.Attribute) and node.func.attr == 'route'
+
+def _is_fastapi_call(node: ast.Call) -> bool:
+    """Match bare get/post/put/delete(...) calls."""
+    return isinstance(node.func, ast.Name) and node.func.id in _FASTAPI_METHODS
+
 class EndpointDetectorStrategy(ABC):
     """Abstract base class for endpoint detection strategies."""
     
@@ -272,122 +454,124 @@ class EndpointDetectorStrategy(ABC):
         self.docstring_parser = DocstringParser()
     
     @abstractmethod
-    def detect_endpoints(self, file_content: str) -> List[EndpointInfo]:
+    def detect_endpoints(self, file_content: str, tree: Optional[ast.Module] = None) -> List[EndpointInfo]:
         """
         Detect endpoints from the file content.
         
         Args:
             file_content: Source code content
+            tree: Parsed AST of the content for Python sources, parsed on demand if omitted
             
         Returns:
             List of detected endpoints
         """
         pass
     
-    def _extract_endpoints_from_docstrings(self, content: str) -> List[EndpointInfo]:
+    def _extract_endpoints_from_docstrings(self, content: str,
+                                           parsed_docstrings: Optional[set] = None) -> List[EndpointInfo]:
         """
         Extract endpoints directly from docstrings in the content.
         
         Args:
             content: Source code content
+            parsed_docstrings: Raw docstring texts the detector already parsed, skipped here
             
         Returns:
             List of endpoints found in docstrings
         """
         endpoints = []
+        parsed_docstrings = parsed_docstrings or set()
         
-        # Find all docstring-like patterns
-        python_docstrings = re.finditer(r'"""(.*?)"""', content, re.DOTALL)
-        js_docstrings = re.finditer(r'/\*(.*?)\*/', content, re.DOTALL)
-        
-        # Process Python-style docstrings
-        for match in python_docstrings:
+        # Walk Python-style and JavaScript-style docstrings in one pass
+        for match in _DOC_BLOCK_RE.finditer(content):
             docstring = match.group(1)
+            if docstring is None:
+                docstring = match.group(2)
+            if docstring in parsed_docstrings:
+                continue
             endpoint_info = self.docstring_parser.parse_docstring(docstring)
             if endpoint_info:
                 endpoints.append(endpoint_info)
         
-        # Process JavaScript-style docstrings
-        for match in js_docstrings:
-            docstring = match.group(1)
-            endpoint_info = self.docstring_parser.parse_docstring(docstring)
-            if endpoint_info:
-                endpoints.append(endpoint_info)
+        return endpoints
+    
+    def _add_docstring_endpoints(self, content: str, endpoints: List[EndpointInfo],
+                                 seen_paths: set, parsed_docstrings: set) -> List[EndpointInfo]:
+        """
+        Append the docstring-only endpoints whose path was not detected yet.
         
+        Args:
+            content: Source code content
+            endpoints: Endpoints already detected from routes, extended in place
+            seen_paths: Paths of the detected endpoints, updated in place
+            parsed_docstrings: Raw docstring texts the detector already parsed
+            
+        Returns:
+            The extended list of endpoints
+        """
+        for endpoint in self._extract_endpoints_from_docstrings(content, parsed_docstrings):
+            if endpoint.path not in seen_paths:
+                endpoints.append(endpoint)
+                seen_paths.add(endpoint.path)
         return endpoints
     
 class PythonVanillaDetector(EndpointDetectorStrategy):
     """Strategy for detecting endpoints in Python using app.route() and docstrings."""
     
-    def detect_endpoints(self, file_content: str) -> List[EndpointInfo]:
+    def detect_endpoints(self, file_content: str, tree: Optional[ast.Module] = None) -> List[EndpointInfo]:
         """
         Detect endpoints from Python source code using both route decorators and docstrings.
         
         Args:
             file_content: Python source code
+            tree: Parsed AST of the source, parsed on demand if omitted
             
         Returns:
             List of detected endpoints
         """
         endpoints: List[EndpointInfo] = []
-        tree = ast.parse(file_content)
+        parsed_docstrings = set()
+        seen_paths = set()
+        if tree is None:
+            tree = ast.parse(file_content, **_PARSE_KWARGS)
         
         # First try to find endpoints through app.route() decorators
-        for node in ast.walk(tree):
-            if (isinstance(node, ast.Call) and 
-                isinstance(node.func, ast.Attribute) and 
-                node.func.attr == 'route'):
-                
-                # Find the corresponding function definition
-                func_def = next(
-                    (n for n in ast.walk(tree) 
-                     if isinstance(n, ast.FunctionDef) and 
-                     n.lineno > node.lineno),
-                    None
+        for node, func_def in _iter_route_calls(tree, _is_route_call):
+            route_info = self._parse_route_decorator(node)
+            # The parser strips every line itself, so the raw docstring is enough
+            docstring = ast.get_docstring(func_def, clean=False) or ""
+            parsed_docstrings.add(docstring)
+            
+            # Try to get endpoint info from docstring first
+            endpoint_info = self.docstring_parser.parse_docstring(docstring)
+            
+            if endpoint_info:
+                # Update with route information if not in docstring
+                if route_info:
+                    if not endpoint_info.path:
+                        endpoint_info.path = route_info["path"]
+                    if not endpoint_info.methods:
+                        endpoint_info.methods = route_info["methods"]
+                    endpoint_info.content_types = route_info["content_types"]
+            else:
+                # Create endpoint info from route decorator if no docstring info
+                endpoint_info = EndpointInfo(
+                    path=route_info["path"],
+                    methods=route_info["methods"],
+                    summary=f"Endpoint for {func_def.name}",
+                    description=inspect.cleandoc(docstring),
+                    parameters=[],
+                    request_schema={"type": "object", "properties": {}},
+                    response_schema={"type": "object", "properties": {}},
+                    content_types=route_info["content_types"],
+                    security=[]
                 )
-                
-                if func_def:
-                    route_info = self._parse_route_decorator(node)
-                    docstring = ast.get_docstring(func_def) or ""
-                    
-                    # Try to get endpoint info from docstring first
-                    endpoint_info = self.docstring_parser.parse_docstring(docstring)
-                    
-                    if endpoint_info:
-                        # Update with route information if not in docstring
-                        if route_info:
-                            if not endpoint_info.path:
-                                endpoint_info.path = route_info["path"]
-                            if not endpoint_info.methods:
-                                endpoint_info.methods = route_info["methods"]
-                            endpoint_info.content_types = route_info["content_types"]
-                    else:
-                        # Create endpoint info from route decorator if no docstring info
-                        endpoint_info = EndpointInfo(
-                            path=route_info["path"],
-                            methods=route_info["methods"],
-                            summary=f"Endpoint for {func_def.name}",
-                            description=docstring,
-                            parameters=[],
-                            request_schema={"type": "object", "properties": {}},
-                            response_schema={"type": "object", "properties": {}},
-                            content_types=route_info["content_types"],
-                            security=[]
-                        )
-                    
-                    endpoints.append(endpoint_info)
+            
+            endpoints.append(endpoint_info)
+            seen_paths.add(endpoint_info.path)
         
         # Then look for endpoints defined only in docstrings
-        docstring_endpoints = self._extract_endpoints_from_docstrings(file_content)
-        
-        # Merge endpoints, avoiding duplicates
-        seen_paths = {endpoint.path for endpoint in endpoints}
-        for endpoint in docstring_endpoints:
-            if endpoint.path not in seen_paths:
-                endpoints.append(endpoint)
-                seen_paths.add(endpoint.path)
-        
-        return endpoints
+        return self._add_docstring_endpoints(file_content, endpoints, seen_paths, parsed_docstrings)
     
     def _parse_route_decorator(self, node: ast.Call) -> Dict[str, Any]:
         """
@@ -413,11 +597,12 @@ class PythonVanillaDetector(EndpointDetectorStrategy):
         for keyword in node.keywords:
             if keyword.arg == "methods":
                 route_details["methods"] = [
-                    method.value for method in keyword.value.elts
+                    _HTTP_METHODS.get(method.value, method.value) for method in keyword.value.elts
                 ]
             elif keyword.arg == "content_types":
                 route_details["content_types"] = [
-                    content_type.value for content_type in keyword.value.elts
+                    _CONTENT_TYPES.get(content_type.value, content_type.value)
+                    for content_type in keyword.value.elts
                 ]
         
         return route_details
@@ -425,57 +610,43 @@ class PythonVanillaDetector(EndpointDetectorStrategy):
 class PythonFlaskDetector(EndpointDetectorStrategy):
     """Strategy for detecting Flask endpoints in Python."""
     
-    def detect_endpoints(self, file_content: str) -> List[EndpointInfo]:
+    def detect_endpoints(self, file_content: str, tree: Optional[ast.Module] = None) -> List[EndpointInfo]:
         """
         Detect Flask endpoints from Python source code.
         
         Args:
             file_content: Python source code
+            tree: Parsed AST of the source, parsed on demand if omitted
             
         Returns:
             List of detected endpoints
         """
         endpoints = []
-        tree = ast.parse(file_content)
+        parsed_docstrings = set()
+        seen_paths = set()
+        if tree is None:
+            tree = ast.parse(file_content, **_PARSE_KWARGS)
         
         # First try to find routes with decorators
-        for node in ast.walk(tree):
-            if (isinstance(node, ast.Call) and 
-                isinstance(node.func, ast.Attribute) and 
-                node.func.attr == 'route'):
-                
-                func_def = next(
-                    (n for n in ast.walk(tree) 
-                     if isinstance(n, ast.FunctionDef) and 
-                     n.lineno > node.lineno),
-                    None
-                )
-                
-                if func_def:
-                    docstring = ast.get_docstring(func_def) or ""
-                    endpoint_info = self.docstring_parser.parse_docstring(docstring)
-                    
-                    if endpoint_info:
-                        # Update path and methods from decorator if not in docstring
-                        route_info = self._parse_flask_route(node)
-                        if route_info:
-                            if not endpoint_info.path:
-                                endpoint_info.path = route_info["path"]
-                            if not endpoint_info.methods:
-                                endpoint_info.methods = route_info["methods"]
-                        endpoints.append(endpoint_info)
+        for node, func_def in _iter_route_calls(tree, _is_route_call):
+            # The parser strips every line itself, so the raw docstring is enough
+            docstring = ast.get_docstring(func_def, clean=False) or ""
+            parsed_docstrings.add(docstring)
+            endpoint_info = self.docstring_parser.parse_docstring(docstring)
+            
+            if endpoint_info:
+                # Update path and methods from decorator if not in docstring
+                route_info = self._parse_flask_route(node)
+                if route_info:
+                    if not endpoint_info.path:
+                        endpoint_info.path = route_info["path"]
+                    if not endpoint_info.methods:
+                        endpoint_info.methods = route_info["methods"]
+                endpoints.append(endpoint_info)
+                seen_paths.add(endpoint_info.path)
         
         # Then look for endpoints defined only in docstrings
-        docstring_endpoints = self._extract_endpoints_from_docstrings(file_content)
-        
-        # Merge endpoints, avoiding duplicates
-        seen_paths = {endpoint.path for endpoint in endpoints}
-        for endpoint in docstring_endpoints:
-            if endpoint.path not in seen_paths:
-                endpoints.append(endpoint)
-                seen_paths.add(endpoint.path)
-        
-        return endpoints
+        return self._add_docstring_endpoints(file_content, endpoints, seen_paths, parsed_docstrings)
     
     def _parse_flask_route(self, node: ast.Call) -> Optional[Dict[str, Any]]:
         """
@@ -501,9 +672,9 @@ class PythonFlaskDetector(EndpointDetectorStrategy):
             # Extract other parameters from keywords
             for keyword in node.keywords:
                 if keyword.arg == "methods":
-                    route_info["methods"] = [m.value for m in keyword.value.elts]
+                    route_info["methods"] = [_HTTP_METHODS.get(m.value, m.value) for m in keyword.value.elts]
                 elif keyword.arg == "content_types":
-                    route_info["content_types"] = [ct.value for ct in keyword.value.elts]
+                    route_info["content_types"] = [_CONTENT_TYPES.get(ct.value, ct.value) for ct in keyword.value.elts]
             
             return route_info
         except AttributeError:
@@ -513,47 +684,37 @@ class PythonFlaskDetector(EndpointDetectorStrategy):
 class PythonFastAPIDetector(EndpointDetectorStrategy):
     """Strategy for detecting FastAPI endpoints in Python."""
     
-    def detect_endpoints(self, file_content: str) -> List[EndpointInfo]:
+    def detect_endpoints(self, file_content: str, tree: Optional[ast.Module] = None) -> List[EndpointInfo]:
         """
         Detect FastAPI endpoints from Python source code.
         
         Args:
             file_content: Python source code
+            tree: Parsed AST of the source, parsed on demand if omitted
             
         Returns:
             List of detected endpoints
         """
         endpoints: List[EndpointInfo] = []
-        tree = ast.parse(file_content)
+        if tree is None:
+            tree = ast.parse(file_content, **_PARSE_KWARGS)
         
-        for node in ast.walk(tree):
-            if (isinstance(node, ast.Call) and 
-                isinstance(node.func, ast.Name) and 
-                node.func.id in ['get', 'post', 'put', 'delete']):
-                
-                func_def = next(
-                    (n for n in ast.walk(tree) 
-                     if isinstance(n, ast.FunctionDef) and 
-                     n.lineno > node.lineno),
-                    None
-                )
-                
-                if func_def:
-                    method = node.func.id.upper()
-                    path = node.args[0].value if node.args else "/"
-                    
-                    docstring = ast.get_docstring(func_def) or ""
-                    doc_info = self._parse_fastapi_docs(docstring)
-                    
-                    endpoints.append(EndpointInfo(
-                        path=path,
-                        methods=[method],
-                        summary=doc_info["summary"],
-                        description=doc_info["description"],
-                        request_schema=doc_info["request_schema"],
-                        response_schema=doc_info["response_schema"],
-                        content_types=["application/json"]
-                    ))
+        for node, func_def in _iter_route_calls(tree, _is_fastapi_call):
+            method = _HTTP_METHODS[node.func.id.upper()]
+            path = node.args[0].value if node.args else "/"
+            
+            docstring = ast.get_docstring(func_def, clean=False) or ""
+            doc_info = self._parse_fastapi_docs(docstring)
+            
+            endpoints.append(EndpointInfo(
+                path=path,
+                methods=[method],
+                summary=doc_info["summary"],
+                description=doc_info["description"],
+                request_schema=doc_info["request_schema"],
+                response_schema=doc_info["response_schema"],
+                content_types=["application/json"]
+            ))
         
         return endpoints
     
@@ -567,46 +728,45 @@ class PythonFastAPIDetector(EndpointDetectorStrategy):
 class TypeScriptExpressDetector(EndpointDetectorStrategy):
     """Strategy for detecting Express.js endpoints in TypeScript/JavaScript."""
     
-    def detect_endpoints(self, file_content: str) -> List[EndpointInfo]:
+    def detect_endpoints(self, file_content: str, tree: Optional[ast.Module] = None) -> List[EndpointInfo]:
         """
         Detect Express.js endpoints from TypeScript/JavaScript source code.
         
         Args:
             file_content: TypeScript/JavaScript source code
+            tree: Unused, JavaScript sources are matched with regexes
             
         Returns:
             List of detected endpoints
         """
         endpoints = []
+        parsed_docstrings = set()
+        seen_paths = set()
         
-        # First try to find Express.js routes
-        route_pattern = r'(app|router)\.(get|post|put|delete)\s*\(\s*[\'"]([^\'"]+)[\'"]'
+        # Index the comment blocks once by end offset
+        comments = list(_JS_DOC_RE.finditer(file_content))
+        comment_ends = [comment.end() for comment in comments]
         
-        for match in re.finditer(route_pattern, file_content):
-            # Find associated docstring
-            docstring_match = re.search(r'/\*(.*?)\*/', file_content[:match.start()], re.DOTALL)
+        # First try to find Express.js routes
+        for match in _TS_ROUTE_RE.finditer(file_content):
+            # Find associated docstring, the closest comment before the route
+            position = bisect.bisect_right(comment_ends, match.start())
             
-            if docstring_match:
-                endpoint_info = self.docstring_parser.parse_docstring(docstring_match.group(1))
+            if position:
+                docstring = comments[position - 1].group(1)
+                parsed_docstrings.add(docstring)
+                endpoint_info = self.docstring_parser.parse_docstring(docstring)
                 if endpoint_info:
                     # Update with route information if not in docstring
                     if not endpoint_info.path:
                         endpoint_info.path = match.group(3)
                     if not endpoint_info.methods:
-                        endpoint_info.methods = [match.group(2).upper()]
+                        endpoint_info.methods = [_HTTP_METHODS[match.group(2).upper()]]
                     endpoints.append(endpoint_info)
+                    seen_paths.add(endpoint_info.path)
         
         # Then look for endpoints defined only in docstrings
-        docstring_endpoints = self._extract_endpoints_from_docstrings(file_content)
-        
-        # Merge endpoints, avoiding duplicates
-        seen_paths = {endpoint.path for endpoint in endpoints}
-        for endpoint in docstring_endpoints:
-            if endpoint.path not in seen_paths:
-                endpoints.append(endpoint)
-                seen_paths.add(endpoint.path)
-        
-        return endpoints
+        return self._add_docstring_endpoints(file_content, endpoints, seen_paths, parsed_docstrings)
     
 
 class OpenAPISpecGenerator:
@@ -625,6 +785,22 @@ class OpenAPISpecGenerator:
                 "express": TypeScriptExpressDetector
             }
         }
+        self._detectors: Dict[Type[EndpointDetectorStrategy], EndpointDetectorStrategy] = {}
+    
+    def _get_detector(self, strategy: Type[EndpointDetectorStrategy]) -> EndpointDetectorStrategy:
+        """
+        Get the detector instance for a strategy, creating it on first use.
+        
+        Args:
+            strategy: Detector strategy class
+            
+        Returns:
+            Shared instance of the strategy
+        """
+        detector = self._detectors.get(strategy)
+        if detector is None:
+            detector = self._detectors[strategy] = strategy()
+        return detector
     
     def generate_specification(self) -> Dict[str, Any]:
         """Generate OpenAPI specification from all source files."""
@@ -651,49 +827,69 @@ class OpenAPISpecGenerator:
             }
         }
         
-        for auth_type, file_paths in self.auth_files.items():
-            for file_path in file_paths:
-                detector, content = self._detect_language_and_framework(file_path)
-                if detector:
-                    endpoints = detector.detect_endpoints(content)
-                    
-                    for endpoint in endpoints:
-                        endpoint.auth_type = auth_type
-                        if endpoint.path not in spec["paths"]:
-                            spec["paths"][endpoint.path] = {}
-                        
-                        for method in endpoint.methods:
-                            operation = {
-                                "summary": endpoint.summary,
-                                "description": endpoint.description,
-                                "parameters": endpoint.parameters,
-                                "responses": {
-                                    "200": {
-                                        "description": "Successful response",
-                                        "content": {
-                                            ct: {"schema": endpoint.response_schema}
-                                            for ct in endpoint.content_types
-                                        }
-                                    }
+        auth_types = [auth_type for auth_type, file_paths in self.auth_files.items() for _ in file_paths]
+        all_file_paths = [file_path for file_paths in self.auth_files.values() for file_path in file_paths]
+        
+        file_endpoints = map(self._detect_file_endpoints, all_file_paths)
+        self._merge_endpoints(spec, zip(auth_types, file_endpoints))
+        
+        return spec
+    
+    def _merge_endpoints(self, spec: Dict[str, Any], file_endpoints: Iterable[Tuple[str, List[EndpointInfo]]]) -> None:
+        """
+        Add the detected endpoints of each file to the specification paths.
+        
+        Args:
+            spec: Specification being generated
+            file_endpoints: Iterable of (auth type, endpoints of one file) pairs
+        """
+        for auth_type, endpoints in file_endpoints:
+            scheme = _AUTH_SCHEMES.get(auth_type)
+            for endpoint in endpoints:
+                path_item = spec["paths"].setdefault(endpoint.path, {})
+                
+                # Each method gets its own operation, responses and parameters list; the
+                # schema, error and parameter objects inside come from the endpoint and
+                # are shared by its methods
+                for method in endpoint.methods:
+                    operation = {
+                        "summary": endpoint.summary,
+                        "description": endpoint.description,
+                        "parameters": list(endpoint.parameters),
+                        "responses": {
+                            "200": {
+                                "description": "Successful response",
+                                "content": {
+                                    ct: {"schema": endpoint.response_schema}
+                                    for ct in endpoint.content_types
                                 }
-                            }
-
+                            },
                             # Add error responses directly to the responses object
-                            if hasattr(endpoint, 'errors'):
-                                for error_code, error_content in endpoint.errors.items():
-                                    operation["responses"][error_code] = error_content
-                            
-                             # Add security requirement based on auth type
-                            if auth_type == "api_key":
-                                operation["security"] = [{"ApiKeyAuth": []}]
-                            elif auth_type == "cognito":
-                                operation["security"] = [{"CognitoAuth": []}]
+                            **endpoint.errors
+                        }
+                    }
+                    # Add security requirement based on auth type
+                    if scheme is not None:
+                        operation["security"] = [{scheme: []}]
                             
-                            spec["paths"][endpoint.path][method.lower()] = operation
+                    path_item[method.lower()] = operation
+    
+    def _detect_file_endpoints(self, file_path: str) -> List[EndpointInfo]:
+        """
+        Detect the endpoints of a single source file.
         
-        return spec
+        Args:
+            file_path: Path to source code file
+            
+        Returns:
+            List of detected endpoints, empty for unsupported files
+        """
+        detector, content, tree = self._detect_language_and_framework(file_path)
+        if detector:
+            return detector.detect_endpoints(content, tree)
+        return []
     
-    def _detect_language_and_framework(self, file_path: str) -> tuple[Optional[EndpointDetectorStrategy], str]:
+    def _detect_language_and_framework(self, file_path: str) -> tuple[Optional[EndpointDetectorStrategy], str, Optional[ast.Module]]:
         """
         Detect the programming language and framework from file content.
         
@@ -701,23 +897,19 @@ class OpenAPISpecGenerator:
             file_path: Path to source code file
             
         Returns:
-            Tuple of (detector strategy, file content)
+            Tuple of (detector strategy, file content, parsed AST for Python sources)
         """
         extension = os.path.splitext(file_path)[1]
         
-        with open(file_path, 'r') as file:
-            content = file.read()
+        content, tree = _load_cached(file_path, os.stat(file_path).st_mtime)
         
         if extension == '.py':
-            if 'fastapi' in content.lower():
-                return self.strategies['.py']['fastapi'](), content
-            if 'flask' in content.lower():
-                return self.strategies['.py']['flask'](), content
-            return self.strategies['.py']['vanilla'](), content
+            framework = _detect_python_framework(tree)
+            return self._get_detector(self.strategies['.py'][framework]), content, tree
         elif extension == '.ts' or extension == '.js':
-            return self.strategies['.ts']['express'](), content
+            return self._get_detector(self.strategies['.ts']['express']), content, None
         
-        return None, content
+        return None, content, None
     
     def save_specification(self, output_path: str = "openapi_spec.json") -> None:
         """
@@ -727,8 +919,14 @@ class OpenAPISpecGenerator:
             output_path: Path to save the specification file
         """
         spec = self.generate_specification()
-        with open(output_path, 'w') as spec_file:
-            json.dump(spec, spec_file, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as spec_file:
+                spec_file.write(orjson.dumps(spec, option=orjson.OPT_INDENT_2))
+        else:
+            # Stream the indented JSON to the file; the spec is a tree, so the
+            # encoder's cycle check can be skipped
+            with open(output_path, 'w', encoding='utf-8') as spec_file:
+                json.dump(spec, spec_file, indent=2, check_circular=False)
         print(f"OpenAPI specification saved to {output_path}")
 
 def parse_input_file(input_file: str) -> Dict[str, List[str]]: